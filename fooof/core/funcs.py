@@ -9,9 +9,53 @@ NOTES
 
 import numpy as np
 
+from fooof.core.modutils import safe_import
+
+numba = safe_import('numba')
+
 ###################################################################################################
 ###################################################################################################
 
+if numba:
+
+    @numba.njit(cache=True, fastmath=True)
+    def _gaussian_nb(xs, params):
+        """Numba compiled kernel for gaussian_function."""
+
+        ys = np.zeros_like(xs)
+
+        for ii in range(0, len(params), 3):
+
+            ctr, amp, wid = params[ii], params[ii+1], params[ii+2]
+
+            for jj in range(len(xs)):
+                ys[jj] += amp * np.exp(-(xs[jj] - ctr)**2 / (2 * wid**2))
+
+        return ys
+
+
+    @numba.njit(cache=True, fastmath=True)
+    def _gaussian_jacobian_nb(xs, params):
+        """Numba compiled kernel for gaussian_jacobian."""
+
+        jacobian = np.empty((len(xs), len(params)))
+
+        for ii in range(0, len(params), 3):
+
+            ctr, amp, wid = params[ii], params[ii+1], params[ii+2]
+
+            for jj in range(len(xs)):
+
+                diff = xs[jj] - ctr
+                exp_val = np.exp(-diff**2 / (2 * wid**2))
+
+                jacobian[jj, ii] = amp * diff / wid**2 * exp_val
+                jacobian[jj, ii+1] = exp_val
+                jacobian[jj, ii+2] = amp * diff**2 / wid**3 * exp_val
+
+        return jacobian
+
+
 def gaussian_function(xs, *params):
     """Gaussian function to use for fitting.
 
@@ -26,17 +70,67 @@ def gaussian_function(xs, *params):
     -------
     ys : 1d array
         Output values for gaussian function.
+
+    Notes
+    -----
+    If numba is available, computation is dispatched to a compiled kernel.
+        Otherwise, a broadcast NumPy implementation is used.
     """
 
-    ys = np.zeros_like(xs)
+    if numba:
+        return _gaussian_nb(np.asarray(xs, dtype='float64'),
+                            np.asarray(params, dtype='float64'))
+
+    # Compute all gaussians at once, broadcasting xs against per-gaussian parameters
+    #  This avoids looping in Python per gaussian, which adds up across residual evaluations
+    ctrs, amps, wids = np.reshape(params, (-1, 3)).T
+
+    ys = np.sum(amps * np.exp(-(xs[:, None] - ctrs)**2 / (2 * wids**2)), axis=1)
+
+    return ys
+
+
+def gaussian_jacobian(xs, *params):
+    """Analytic Jacobian of the gaussian function, to use for fitting.
+
+    Parameters
+    ----------
+    xs : 1d array
+        Input x-axis values.
+    *params : float
+        Parameters that define gaussian function.
+
+    Returns
+    -------
+    jacobian : 2d array
+        Partial derivatives of the gaussian function with respect to each parameter.
+            Shape is [n_xs, n_params], with columns ordered as [ctr, amp, wid] per gaussian.
+
+    Notes
+    -----
+    Providing this to the fitting routine avoids estimating the Jacobian with finite
+        differences, which costs extra function evaluations on every iteration of the fit.
+    If numba is available, computation is dispatched to a compiled kernel.
+    """
+
+    if numba:
+        return _gaussian_jacobian_nb(np.asarray(xs, dtype='float64'),
+                                     np.asarray(params, dtype='float64'))
+
+    jacobian = np.empty((len(xs), len(params)))
 
     for ii in range(0, len(params), 3):
 
         ctr, amp, wid = params[ii:ii+3]
 
-        ys = ys + amp * np.exp(-(xs-ctr)**2 / (2*wid**2))
+        diffs = xs - ctr
+        exp_vals = np.exp(-diffs**2 / (2 * wid**2))
 
-    return ys
+        jacobian[:, ii] = amp * diffs / wid**2 * exp_vals
+        jacobian[:, ii+1] = exp_vals
+        jacobian[:, ii+2] = amp * diffs**2 / wid**3 * exp_vals
+
+    return jacobian
 
 
 def expo_function(xs, *params):
@@ -58,11 +152,9 @@ def expo_function(xs, *params):
         Output values for exponential function.
     """
 
-    ys = np.zeros_like(xs)
-
     offset, knee, exp = params
 
-    ys = ys + offset - np.log10(knee + xs**exp)
+    ys = offset - np.log10(knee + xs**exp)
 
     return ys
 
@@ -87,11 +179,11 @@ def expo_nk_function(xs, *params):
         Output values for exponential (no-knee) function.
     """
 
-    ys = np.zeros_like(xs)
-
     offset, exp = params
 
-    ys = ys + offset - np.log10(xs**exp)
+    # Note: log10(xs**exp) is computed as exp * log10(xs), which is equivalent
+    #  but skips evaluating the power, leaving one transcendental pass per call
+    ys = offset - exp * np.log10(xs)
 
     return ys
 
@@ -112,11 +204,9 @@ def linear_function(xs, *params):
         Output values for linear function.
     """
 
-    ys = np.zeros_like(xs)
-
     offset, slope = params
 
-    ys = ys + offset + (xs*slope)
+    ys = offset + (xs*slope)
 
     return ys
 
@@ -137,11 +227,11 @@ def quadratic_function(xs, *params):
         Output values for quadratic function.
     """
 
-    ys = np.zeros_like(xs)
-
     offset, slope, curve = params
 
-    ys = ys + offset + (xs*slope) + ((xs**2)*curve)
+    # Evaluate with Horner's method, which runs as a single pass with no
+    #  intermediate arrays for the squared term
+    ys = np.polyval([curve, slope, offset], xs)
 
     return ys
 
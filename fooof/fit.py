@@ -36,14 +36,14 @@ from copy import deepcopy
 from collections import namedtuple
 
 import numpy as np
-from scipy.optimize import curve_fit
+from scipy.optimize import least_squares
 
 from fooof.utils import trim_spectrum
 from fooof.plts.fm import plot_fm
 from fooof.core.io import save_fm, load_json
 from fooof.core.reports import save_report_fm
-from fooof.core.funcs import gaussian_function, get_ap_func, infer_ap_func
-from fooof.core.utils import group_three, check_array_dim, get_obj_desc
+from fooof.core.funcs import gaussian_function, gaussian_jacobian, get_ap_func, infer_ap_func
+from fooof.core.utils import check_array_dim, get_obj_desc
 from fooof.core.modutils import copy_doc_func_to_method
 from fooof.core.strings import gen_settings_str, gen_results_str_fm, gen_issue_str, gen_wid_warn_str
 
@@ -340,7 +340,7 @@ class FOOOF(object):
             self._check_width_limits()
 
         # In rare cases, the model fails to fit. Therefore it's in a try/except
-        #  Cause of failure: RuntimeError, failure to find parameters in curve_fit
+        #  Cause of failure: RuntimeError, raised when least_squares fails to find parameters
         try:
 
             # Fit the aperiodic component
@@ -375,7 +375,7 @@ class FOOOF(object):
             self._calc_r_squared()
             self._calc_rmse_error()
 
-        # Catch failure, stemming from curve_fit process
+        # Catch failure, stemming from the fitting process
         except RuntimeError:
 
             # Clear any interim model results that may have run
@@ -531,17 +531,23 @@ class FOOOF(object):
                          ([self._ap_guess[1]] if self.aperiodic_mode == 'knee' else []) +
                          [self._ap_guess[2]])
 
-        # Ignore warnings that are raised in curve_fit
-        #  A runtime warning can occur while exploring parameters in curve fitting
+        # Ignore warnings that are raised during fitting
+        #  A runtime warning can occur while exploring parameters in the fit
         #    This doesn't effect outcome - it won't settle on an answer that does this
         #  It happens if / when b < 0 & |b| > x**2, as it leads to log of a negative number
+        #  least_squares is called directly, skipping the sigma handling and covariance
+        #   estimation of the curve_fit wrapper, neither of which is used here
+        ap_func = get_ap_func(self.aperiodic_mode)
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            aperiodic_params, _ = curve_fit(get_ap_func(self.aperiodic_mode),
-                                            freqs, power_spectrum, p0=guess,
-                                            maxfev=5000, bounds=self._ap_bounds)
+            fit_res = least_squares(lambda params: ap_func(freqs, *params) - power_spectrum,
+                                    guess, bounds=self._ap_bounds, max_nfev=5000,
+                                    ftol=1e-5, xtol=1e-5)
 
-        return aperiodic_params
+        if not fit_res.success:
+            raise RuntimeError('Optimal parameters not found: ' + fit_res.message)
+
+        return fit_res.x
 
 
     def _robust_ap_fit(self, freqs, power_spectrum):
@@ -578,11 +584,16 @@ class FOOOF(object):
 
         # Second aperiodic fit - using results of first fit as guess parameters
         #  See note in _simple_ap_fit about warnings
+        ap_func = get_ap_func(self.aperiodic_mode)
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            aperiodic_params, _ = curve_fit(get_ap_func(self.aperiodic_mode),
-                                            freqs_ignore, spectrum_ignore, p0=popt,
-                                            maxfev=5000, bounds=self._ap_bounds)
+            fit_res = least_squares(lambda params: ap_func(freqs_ignore, *params) - spectrum_ignore,
+                                    popt, bounds=self._ap_bounds, max_nfev=5000,
+                                    ftol=1e-5, xtol=1e-5)
+
+        # If the refit fails, fall back on the initial fit parameters,
+        #  rather than failing the whole model fit
+        aperiodic_params = fit_res.x if fit_res.success else popt
 
         return aperiodic_params
 
@@ -604,6 +615,11 @@ class FOOOF(object):
         # Initialize matrix of guess parameters for gaussian fitting.
         guess = np.empty([0, 3])
 
+        # Pre-compute values that stay constant across the search loop
+        #  This includes the FWHM to gaussian std conversion factor, and the std limits
+        fwhm_std_ratio = 2 * np.sqrt(2 * np.log(2))
+        lo_std_limit, hi_std_limit = self._gauss_std_limits
+
         # Find peak: Loop through, finding a candidate peak, and fitting with a guass gaussian.
         #  Stopping procedure based on either # of peaks, or the threshold/amplitude limits.
         while len(guess) < self.max_n_peaks:
@@ -626,10 +642,13 @@ class FOOOF(object):
 
             # Data-driven first guess BW
             #  Find half-amp index on each side of the center frequency.
+            #  The comparisons run as single vectorized passes, rather than scanning
+            #   point-by-point in Python from the peak outwards.
             half_amp = 0.5 * max_amp
-            le_ind = next((x for x in range(max_ind - 1, 0, -1) if flat_iter[x] <= half_amp), None)
-            ri_ind = next((x for x in range(max_ind + 1, len(flat_iter), 1)
-                           if flat_iter[x] <= half_amp), None)
+            le_below = np.flatnonzero(flat_iter[1:max_ind] <= half_amp) + 1
+            ri_below = np.flatnonzero(flat_iter[max_ind + 1:] <= half_amp) + max_ind + 1
+            le_ind = le_below[-1] if le_below.size else None
+            ri_ind = ri_below[0] if ri_below.size else None
 
             # Keep bandwidth estimation from the shortest side.
             #  We grab shortest to avoid estimating very large std from overalapping peaks.
@@ -639,14 +658,14 @@ class FOOOF(object):
 
             # Estimate std from FWHM. Calculate FWHM, converting to Hz, get guess std from FWHM
             fwhm = shortest_side * 2 * self.freq_res
-            guess_std = fwhm / (2 * np.sqrt(2 * np.log(2)))
+            guess_std = fwhm / fwhm_std_ratio
 
             # Check that guess std isn't outside preset std limits; restrict if so.
-            #  Note: without this, curve_fitting fails if given guess > or < bounds.
-            if guess_std < self._gauss_std_limits[0]:
-                guess_std = self._gauss_std_limits[0]
-            if guess_std > self._gauss_std_limits[1]:
-                guess_std = self._gauss_std_limits[1]
+            #  Note: without this, the fit errors out if given a guess outside the bounds.
+            if guess_std < lo_std_limit:
+                guess_std = lo_std_limit
+            if guess_std > hi_std_limit:
+                guess_std = hi_std_limit
 
             # Collect guess parameters.
             guess = np.vstack((guess, (guess_freq, guess_amp, guess_std)))
@@ -686,31 +705,38 @@ class FOOOF(object):
 
         # Set the bounds for center frequency, enforce positive amp value, and set bandwidth limits.
         #  Note that 'guess' is in terms of gaussian std, so +/- BW is 2 * the guess_gauss_std.
-        #  This set of list comprehensions is a way to end up with bounds in the form:
-        #   ((cf_low_bound_peak1, amp_low_bound_peak1, bw_low_bound_peak1, *repeated for n_peak*),
-        #    (cf_high_bound_peak1, amp_high_bound_peak1, bw_high_bound_peak, *repeated for n_peak*))
-        lo_bound = [[peak[0] - 2 * self._cf_bound * peak[2], 0, self._gauss_std_limits[0]]
-                    for peak in guess]
-        hi_bound = [[peak[0] + 2 * self._cf_bound * peak[2], np.inf, self._gauss_std_limits[1]]
-                    for peak in guess]
+        #  Bounds are built columnwise on the [n_peaks, 3] guess matrix, and then
+        #   flattened to match the flat parameter vector that the fit function uses.
+        lo_bound = np.empty_like(guess)
+        hi_bound = np.empty_like(guess)
+
+        # CF bounds are restricted to stay within the fitted frequency range
+        lo_bound[:, 0] = np.maximum(guess[:, 0] - 2 * self._cf_bound * guess[:, 2],
+                                    self.freq_range[0])
+        hi_bound[:, 0] = np.minimum(guess[:, 0] + 2 * self._cf_bound * guess[:, 2],
+                                    self.freq_range[1])
 
-        # Check that CF bounds are within frequency range, and, if not, updates them to be restricted to frequency range.
-        lo_bound = [bound if bound[0] > self.freq_range[0] else [self.freq_range[0], *bound[1:]] for bound in lo_bound]
-        hi_bound = [bound if bound[0] < self.freq_range[1] else [self.freq_range[1], *bound[1:]] for bound in hi_bound]
+        lo_bound[:, 1], hi_bound[:, 1] = 0, np.inf
+        lo_bound[:, 2], hi_bound[:, 2] = self._gauss_std_limits
 
-        # Unpacks the embedded lists into flat tuples, which is what the fit function requires as input.
-        gaus_param_bounds = (tuple([item for sublist in lo_bound for item in sublist]),
-                             tuple([item for sublist in hi_bound for item in sublist]))
+        gaus_param_bounds = (lo_bound.ravel(), hi_bound.ravel())
 
-        # Flatten guess, for use with curve fit.
-        guess = np.ndarray.flatten(guess)
+        # Flatten guess, as the fit uses a flat parameter vector.
+        guess = guess.ravel()
 
         # Fit the peaks.
-        gaussian_params, _ = curve_fit(gaussian_function, self.freqs, self._spectrum_flat,
-                                       p0=guess, maxfev=5000, bounds=gaus_param_bounds)
+        #  The analytic Jacobian is provided to avoid finite difference estimation,
+        #   which would cost extra function evaluations on every fit iteration.
+        fit_res = least_squares(
+            lambda params: gaussian_function(self.freqs, *params) - self._spectrum_flat,
+            guess, jac=lambda params: gaussian_jacobian(self.freqs, *params),
+            bounds=gaus_param_bounds, max_nfev=5000, ftol=1e-5, xtol=1e-5)
+
+        if not fit_res.success:
+            raise RuntimeError('Optimal parameters not found: ' + fit_res.message)
 
         # Re-organize params into 2d matrix.
-        gaussian_params = np.array(group_three(gaussian_params))
+        gaussian_params = fit_res.x.reshape(-1, 3)
 
         return gaussian_params
 
@@ -746,7 +772,11 @@ class FOOOF(object):
         for ii, peak in enumerate(gaus_params):
 
             # Gets the index of the power_spectrum at the frequency closest to the CF of the peak
-            ind = min(range(len(self.freqs)), key=lambda ii: abs(self.freqs[ii] - peak[0]))
+            #  Freqs are sorted, so searchsorted gets the nearest index without a full scan
+            ind = np.searchsorted(self.freqs, peak[0])
+            if ind > 0 and (ind == len(self.freqs) or
+                            abs(self.freqs[ind-1] - peak[0]) <= abs(self.freqs[ind] - peak[0])):
+                ind -= 1
 
             # Collect peak parameter data
             peak_params = np.vstack((peak_params,
@@ -771,16 +801,16 @@ class FOOOF(object):
             Guess parameters for gaussian fits to peaks. [n_peaks, 3], row: [CF, amp, BW].
         """
 
-        cf_params = [item[0] for item in guess]
-        bw_params = [item[2] * self._bw_std_edge for item in guess]
+        cf_params = guess[:, 0]
+        bw_params = guess[:, 2] * self._bw_std_edge
 
         # Check if peaks within drop threshold from the edge of the frequency range.
         keep_peak = \
-            (np.abs(np.subtract(cf_params, self.freq_range[0])) > bw_params) & \
-            (np.abs(np.subtract(cf_params, self.freq_range[1])) > bw_params)
+            (np.abs(cf_params - self.freq_range[0]) > bw_params) & \
+            (np.abs(cf_params - self.freq_range[1]) > bw_params)
 
         # Drop peaks that fail CF edge criterion
-        guess = np.array([d for (d, keep) in zip(guess, keep_peak) if keep])
+        guess = guess[keep_peak]
 
         return guess
 
@@ -804,28 +834,24 @@ class FOOOF(object):
             the lower amplitude guess is dropped.
         """
 
-        # Sort the peak guesses, so can check overlap of adjacent peaks
-        guess = sorted(guess, key=lambda x: float(x[0]))
+        # Sort the peak guesses by CF, so adjacent rows are neighboring peaks
+        guess = guess[np.argsort(guess[:, 0], kind='stable')]
+        cfs, amps = guess[:, 0], guess[:, 1]
 
         # Calculate standard deviation bounds for checking amount of overlap
-        bounds = [[peak[0] - peak[2] * self._gauss_overlap_thresh, peak[0],
-                   peak[0] + peak[2] * self._gauss_overlap_thresh] for peak in guess]
-
-        drop_inds = []
-
-        # Loop through peak bounds, comparing current bound to that of next peak
-        for ind, b_0 in enumerate(bounds[:-1]):
-            b_1 = bounds[ind + 1]
-
-            # Check if bound of current peak extends into next peak
-            if b_0[1] > b_1[0]:
+        #  A pair overlaps if the lower bound of the higher-CF peak extends below
+        #   the CF of the lower one
+        lo_bounds = cfs - guess[:, 2] * self._gauss_overlap_thresh
+        overlaps = cfs[:-1] > lo_bounds[1:]
 
-                # If so, get the index of the lowest amplitude peak (to drop)
-                drop_inds.append([ind, ind + 1][np.argmin([guess[ind][1], guess[ind + 1][1]])])
+        # For each overlapping pair, mark the lower amplitude peak to be dropped
+        pair_inds = np.arange(len(guess) - 1)
+        drop_inds = np.where(amps[:-1] <= amps[1:], pair_inds, pair_inds + 1)[overlaps]
 
-        # Drop any peaks guesses that overlap too much, based on threshold.
-        keep_peak = [True if j not in drop_inds else False for j in range(len(guess))]
-        guess = np.array([d for (d, keep) in zip(guess, keep_peak) if keep])
+        # Drop any peak guesses that overlap too much, based on threshold.
+        keep_peak = np.ones(len(guess), dtype=bool)
+        keep_peak[drop_inds] = False
+        guess = guess[keep_peak]
 
         return guess
 
@@ -887,7 +913,7 @@ class FOOOF(object):
             raise ValueError('Inputs are not consistent size.')
 
         # Force data to be dtype of float64.
-        #   If they end up as float32, or less, scipy curve_fit fails (sometimes implicitly)
+        #   If they end up as float32, or less, the scipy fitting routines fail (sometimes implicitly)
         if freqs.dtype != 'float64':
             freqs = freqs.astype('float64')
         if power_spectrum.dtype != 'float64':
@@ -899,13 +925,15 @@ class FOOOF(object):
         else:
             freqs, power_spectrum = freqs, power_spectrum
 
-        # Check if freqs start at 0 - move up one value if so.
-        #   Aperiodic fit gets an inf is freq of 0 is included, which leads to an error.
-        if freqs[0] == 0.0:
-            freqs, power_spectrum = trim_spectrum(freqs, power_spectrum, [freqs[1], freqs.max()])
+        # Check if freqs start at or below 0 - if so, trim to the first positive frequency.
+        #   Aperiodic fit gets an inf if a freq of 0 is included, which leads to an error,
+        #   and any non-positive frequency propagates infs/NaNs through the log10 evaluations.
+        if freqs[0] <= 0.0:
+            freqs, power_spectrum = trim_spectrum(freqs, power_spectrum,
+                                                  [freqs[freqs > 0.0].min(), freqs.max()])
             if verbose:
-                print("\nFOOOF WARNING: Skipping frequency == 0,"
-                      " as this causes a problem with fitting.")
+                print("\nFOOOF WARNING: Skipping frequencies <= 0,"
+                      " as these cause a problem with fitting.")
 
         # Calculate frequency resolution, and actual frequency range of the data
         freq_range = [freqs.min(), freqs.max()]
@@ -2,7 +2,7 @@
 
 import numpy as np
 
-from fooof import FOOOFGroup
+from fooof import FOOOF, FOOOFGroup
 from fooof.synth.gen import gen_freqs
 from fooof.utils import get_settings, get_obj_desc, compare_settings, compare_data_info
 
@@ -30,18 +30,21 @@ def combine_fooofs(fooofs):
 
     # Initialize FOOOFGroup object, with settings derived from input objects
     fg = FOOOFGroup(**get_settings(fooofs[0]), verbose=fooofs[0].verbose)
-    fg.power_spectra = np.empty([0, len(fooofs[0].freqs)])
 
     # Add FOOOF results from each FOOOF object to group
+    #  Power spectra are collected into a list, and stacked once at the end,
+    #   to avoid re-copying the accumulated matrix for every object added
+    spectra = [np.empty([0, len(fooofs[0].freqs)])]
     for f_obj in fooofs:
         # Add FOOOFGroup object
         if isinstance(f_obj, FOOOFGroup):
             fg.group_results.extend(f_obj.group_results)
-            fg.power_spectra = np.vstack([fg.power_spectra, f_obj.power_spectra])
+            spectra.append(f_obj.power_spectra)
         # Add FOOOF object
         else:
             fg.group_results.append(f_obj.get_results())
-            fg.power_spectra = np.vstack([fg.power_spectra, f_obj.power_spectrum])
+            spectra.append(f_obj.power_spectrum[np.newaxis, :])
+    fg.power_spectra = np.vstack(spectra)
 
     # Add data information information
     for data_info in get_obj_desc()['freq_info']:
@@ -74,9 +77,35 @@ def fit_fooof_group_3d(fg, freqs, power_spectra, freq_range=None, n_jobs=1):
         Collected FOOOFGroups after fitting across power spectra, length of n_conditions.
     """
 
+    # Warm-start the aperiodic fits: fit the mean spectrum of the collection first,
+    #  and seed the group's aperiodic guess parameters from that solution.
+    #  Spectra within a collection are typically similar, so starting each fit near
+    #  the collection-level solution reduces the optimizer iterations needed per spectrum.
+    #  The original guess is kept aside, and put back after fitting, so that the
+    #  data-derived seed does not leak into any later fits with these objects.
+    orig_ap_guess = fg._ap_guess
+    fm = FOOOF(**get_settings(fg), verbose=False)
+    fm.fit(freqs, np.mean(power_spectra, axis=(0, 1)), freq_range)
+    if np.all(np.isfinite(fm.aperiodic_params_)):
+        fg._ap_guess = list(fm.aperiodic_params_) if fg.aperiodic_mode == 'knee' \
+            else [fm.aperiodic_params_[0], 0, fm.aperiodic_params_[1]]
+
+    # Fit all spectra at once, collapsing conditions into a single group fit
+    #  This keeps one worker pool alive across all conditions when running in parallel,
+    #  rather than spinning up and tearing down a pool per condition
+    n_conditions, n_spectra, n_freqs = power_spectra.shape
+    fg.fit(freqs, np.reshape(power_spectra, (n_conditions * n_spectra, n_freqs)),
+           freq_range, n_jobs)
+
+    # Restore the original guess parameters before copying out the results
+    fg._ap_guess = orig_ap_guess
+
+    # Split the results back out into a FOOOFGroup per condition
     fgs = []
-    for cond_spectra in power_spectra:
-        fg.fit(freqs, cond_spectra, freq_range, n_jobs)
-        fgs.append(fg.copy())
+    for ind in range(n_conditions):
+        cond_fg = fg.copy()
+        cond_fg.group_results = fg.group_results[ind * n_spectra:(ind + 1) * n_spectra]
+        cond_fg.power_spectra = fg.power_spectra[ind * n_spectra:(ind + 1) * n_spectra]
+        fgs.append(cond_fg)
 
     return fgs
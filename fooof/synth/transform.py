@@ -31,15 +31,14 @@ def rotate_spectrum(freqs, power_spectrum, delta_f, f_rotation):
     if f_rotation < freqs.min() or f_rotation > freqs.max():
         raise ValueError('Rotation frequency not within frequency range.')
 
-    f_mask = np.zeros_like(freqs)
-
     f_mask = 10**(np.log10(np.abs(freqs)) * (delta_f))
 
     # If starting freq is 0Hz, default power at 0Hz to keep same value because log will return inf.
     if freqs[0] == 0.:
         f_mask[0] = 1.
 
-    f_mask = f_mask / f_mask[np.where(freqs >= f_rotation)[0][0]]
+    # Freqs are sorted, so searchsorted gets the first index at or above the rotation frequency
+    f_mask = f_mask / f_mask[np.searchsorted(freqs, f_rotation)]
 
     rotated_spectrum = f_mask * power_spectrum
 
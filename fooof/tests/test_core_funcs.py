@@ -24,6 +24,22 @@ def test_gaussian_function():
     assert max(ys) == amp
     assert np.allclose([i/sum(ys) for i in ys], norm.pdf(xs, ctr, wid))
 
+def test_gaussian_jacobian():
+
+    ctr, amp, wid = 50, 5, 10
+
+    xs = np.arange(1, 100)
+    jacobian = gaussian_jacobian(xs, ctr, amp, wid)
+
+    assert jacobian.shape == (len(xs), 3)
+
+    # Check analytic partial derivatives against finite difference estimates
+    step = 1e-6
+    for ind, params in enumerate([[ctr + step, amp, wid], [ctr, amp + step, wid],
+                                  [ctr, amp, wid + step]]):
+        diffs = (gaussian_function(xs, *params) - gaussian_function(xs, ctr, amp, wid)) / step
+        assert np.allclose(jacobian[:, ind], diffs, atol=1e-4)
+
 def test_expo_function():
 
     off, knee, exp = 10, 5, 2